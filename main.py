@@ -1,11 +1,25 @@
+import time
+START_TIME = time.perf_counter()  # Taken before the Qt imports so startup timing covers them
+
 import sys
+from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QApplication
 from variable_manager import VariableManager
 
 def main():
     app = QApplication(sys.argv)
-    window = VariableManager()
+
+    # Set the font to Open Sans regular (or fallback to Arial if not available)
+    font = QFont("Open Sans", 10)  # Font size 10
+    if not font.family() == "Open Sans":
+        font = QFont("Arial", 10)  # Fallback to Arial if Open Sans is unavailable
+    app.setFont(font)
+
+    # Show the window first; the variables load in the background and the
+    # time to interactive is printed once they are in (see VariableManager.on_variables_loaded)
+    window = VariableManager(start_time=START_TIME)
     window.show()
+
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
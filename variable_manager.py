@@ -1,22 +1,57 @@
-import json
+import math
 import os
-import sys
-from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QDialog, QFormLayout, QDialogButtonBox, QMessageBox, QLineEdit, QComboBox, QColorDialog, QLabel
+import time
+from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QDialog, QFormLayout, QDialogButtonBox, QMessageBox, QLineEdit, QComboBox, QColorDialog, QLabel, QListWidget, QAbstractItemView, QProgressBar
 from utils import load_json, save_json
 
+BULK_EDIT_MODES = ["set", "offset", "scale"]
+NUMERIC_TYPES = ["integer", "float", "color", "vector"]
+
+class VariableLoader(QThread):
+    """Load the variables file off the UI thread so the window can paint first."""
+    loaded = pyqtSignal(object)  # object, not dict, so the variables are not converted to a QVariantMap
+    failed = pyqtSignal(str)
+
+    def __init__(self, load_function, parent=None):
+        super().__init__(parent)
+        self.load_function = load_function
+
+    def run(self):
+        try:
+            variables = self.load_function()
+        except Exception as e:  # An exception escaping run() would abort the application
+            self.failed.emit(str(e))
+            return
+        self.loaded.emit(variables)
+
 class VariableManager(QWidget):
-    def __init__(self):
+    # Emitted once per override edit, or once per bulk edit, with the (variable_name, shot) pairs that changed
+    variables_changed = pyqtSignal(list)
+
+    def __init__(self, start_time=None):
         super().__init__()
-        self.setWindowTitle("Variable Manager")
+        # Used to report cold start to interactive; main passes the time the process started
+        self.start_time = time.perf_counter() if start_time is None else start_time
+        self.setWindowTitle("Variable Manager[*]")  # [*] shows unpublished changes
         self.base_directory = "E:/dev/projects/vfx/misc.tools/variable_manager_app/json_files"
         os.makedirs(self.base_directory, exist_ok=True)
         self.base_filename = os.path.join(self.base_directory, "variables")
         self.latest_file = f"{self.base_filename}_latest.json"
-        self.variables = self.load_latest_variables()
+        self.variables = {}  # Filled in by the loader thread, see load_variables_async
+        self.variables_loaded = False  # Publishing is refused until the latest file has been read
+        self.loader = None
+        self.undo_stack = []  # One entry per bulk edit: list of (name, variable_data, shot, had_override, old_value, new_value)
+        # Dialogs are built on first use and reused afterwards
+        self.add_variable_dialog = None
+        self.overrides_dialog = None
+        self.bulk_edit_dialog = None
         self.setFixedWidth(600)
+        self.variables_changed.connect(self.on_variables_changed)
         self.init_ui()
+        self.set_loading(True)
+        # Start loading once the event loop is running, so the window is shown first
+        QTimer.singleShot(0, self.load_variables_async)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -26,16 +61,25 @@ class VariableManager(QWidget):
         self.table.setHorizontalHeaderLabels(["Name", "Type", "Default Value", "Override Per Shot"])
         self.table.setEditTriggers(QTableWidget.AllEditTriggers)  # Allow editing in all columns except type
         self.table.itemChanged.connect(self.on_table_item_changed)  # Connect item changes
+        self.table.cellDoubleClicked.connect(self.on_table_cell_double_clicked)  # Open overrides from column 3
         layout.addWidget(self.table)
 
         self.table.setColumnWidth(0, 100)  # Set "Name" column width to 200px
         self.table.setColumnWidth(1, 100)  # Set "Type" column width to 150px
         self.table.setColumnWidth(2, 100)  # Set "Default Value" column width to 150px
         self.table.setColumnWidth(3, 250)  # Set "Override Per Shot" column width to 200px
-        # Disable editing for the "Type" column (index 1)
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 1)
-            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+
+        # Shown while the variables file is loading, or if loading failed
+        status_layout = QHBoxLayout()
+        self.status_label = QLabel(f"Loading {self.latest_file}...")
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # No known length, so show a busy indicator
+        self.retry_button = QPushButton("Retry")
+        self.retry_button.clicked.connect(self.load_variables_async)
+        status_layout.addWidget(self.status_label)
+        status_layout.addWidget(self.progress_bar)
+        status_layout.addWidget(self.retry_button)
+        layout.addLayout(status_layout)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -48,13 +92,21 @@ class VariableManager(QWidget):
         delete_row_button = QPushButton("Delete Selected Row")
         delete_row_button.clicked.connect(self.delete_selected_row)
 
+        bulk_edit_button = QPushButton("Bulk Edit")
+        bulk_edit_button.clicked.connect(self.bulk_edit)
+
+        undo_button = QPushButton("Undo Bulk Edit")
+        undo_button.clicked.connect(self.undo_last_edit)
+
         button_layout.addWidget(add_variable_button)
         button_layout.addWidget(publish_button)
         button_layout.addWidget(delete_row_button)
+        button_layout.addWidget(bulk_edit_button)
+        button_layout.addWidget(undo_button)
         layout.addLayout(button_layout)
 
-        # Refresh table and clear selection
-        self.refresh_table()
+        # Disabled until the variables have finished loading
+        self.loading_widgets = [self.table, add_variable_button, publish_button, delete_row_button, bulk_edit_button, undo_button]
 
         # Ensure no row, column, or cell is selected when the table is first displayed
         self.table.clearSelection()
@@ -136,11 +188,16 @@ class VariableManager(QWidget):
         # Add the variable to the dictionary
         self.variables[name] = {"type": var_type, "default": default_value, "overrides": {}}
 
-        # Refresh the table
-        self.refresh_table()
+        # Append the new row rather than rebuilding the whole table
+        row = self.table.rowCount()
+        self.table.blockSignals(True)
+        self.table.insertRow(row)
+        self.set_table_row(row, name, self.variables[name])
+        self.table.blockSignals(False)
 
         # Print for debugging
         print(f"Variable added: {name} of type {var_type} with default {default_value}")
+        self.setWindowModified(True)
 
         # Accept the dialog
         dialog = None
@@ -177,11 +234,64 @@ class VariableManager(QWidget):
         except ValueError:
             return False
 
+    def load_variables_async(self):
+        """Start loading the latest variables in a background thread."""
+        self.load_start_time = time.perf_counter()
+        self.set_loading(True)
+        self.status_label.setText(f"Loading {self.latest_file}...")
+        # A single loader is reused by Retry; a finished QThread can be started again
+        if self.loader is None:
+            self.loader = VariableLoader(self.load_latest_variables, self)
+            self.loader.loaded.connect(self.on_variables_loaded)
+            self.loader.failed.connect(self.on_variables_load_failed)
+        self.loader.start()
+
+    def set_loading(self, loading):
+        """Toggle the loading state of the main window."""
+        for widget in self.loading_widgets:
+            widget.setEnabled(not loading)
+        self.status_label.setVisible(loading)
+        self.progress_bar.setVisible(loading)
+        self.retry_button.setVisible(False)
+
+    def on_variables_loaded(self, variables):
+        """Populate the table once the loader thread has finished."""
+        self.variables = variables
+        self.variables_loaded = True
+        self.refresh_table()
+        self.set_loading(False)
+        now = time.perf_counter()
+        print(f"Loaded {len(variables)} variables in {now - self.load_start_time:.3f}s, interactive {now - self.start_time:.3f}s after start")
+
+    def on_variables_load_failed(self, message):
+        """Show a failed load and keep editing and publishing disabled until a retry succeeds."""
+        self.progress_bar.setVisible(False)
+        self.status_label.setText(f"Could not load {self.latest_file}: {message}")
+        self.retry_button.setVisible(True)
+
+    def closeEvent(self, event):
+        """Let a running load finish before the window, and its loader thread, are destroyed."""
+        if self.loader is not None:
+            self.loader.wait()
+        super().closeEvent(event)
+
     def load_latest_variables(self):
         """Load the latest variables from the latest JSON file."""
-        if os.path.exists(self.latest_file):
-            return load_json(self.latest_file).get("variables", {})
-        return {}
+        if not os.path.exists(self.latest_file):
+            return {}
+        data = load_json(self.latest_file)
+        if not isinstance(data, dict) or not isinstance(data.get("variables", {}), dict):
+            raise ValueError("expected an object with a 'variables' object.")
+        variables = data.get("variables", {})
+
+        # Check every entry here, on the loader thread, so bad data shows the failed state
+        # instead of raising in refresh_table on the GUI thread
+        for name, variable_data in variables.items():
+            if not isinstance(variable_data, dict) or not isinstance(variable_data.get("type"), str) or "default" not in variable_data:
+                raise ValueError(f"variable '{name}' must be an object with a 'type' string and a 'default'.")
+            if not isinstance(variable_data.get("overrides", {}), dict):
+                raise ValueError(f"variable '{name}' has overrides that are not an object.")
+        return variables
 
     def save_to_file(self, filename):
         """Save the current variables to a specified file in JSON format."""
@@ -197,36 +307,60 @@ class VariableManager(QWidget):
 
     def publish_new_version(self):
         """Publish the current variables as a new version and update the 'latest' file."""
+        if not self.variables_loaded:
+            # Never overwrite the latest file with a state that was not loaded from it
+            QMessageBox.warning(self, "Error", "Variables have not been loaded, nothing was published.")
+            return
         versioned_file = self.get_next_version_filename()
         self.save_to_file(versioned_file)
         self.save_to_file(self.latest_file)
+        self.setWindowModified(False)
         QMessageBox.information(self, "Success", f"Published new version: {versioned_file}")
 
+    def on_variables_changed(self, changes):
+        """Mark the window as having unpublished changes."""
+        self.setWindowModified(True)
+
     def refresh_table(self):
         """Update the main table with current variables."""
+        # Avoid a repaint and an itemChanged round trip per cell while filling the table
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
         self.table.setRowCount(0)  # Clear existing rows
-        for name, data in self.variables.items():
-            row = self.table.rowCount()
-            self.table.insertRow(row)
+        self.table.setRowCount(len(self.variables))
+        for row, (name, data) in enumerate(self.variables.items()):
+            self.set_table_row(row, name, data)
 
-            # Name column (editable by default)
-            self.table.setItem(row, 0, QTableWidgetItem(name))
+        self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(True)
 
-            # Type column (non-editable)
-            type_item = QTableWidgetItem(data["type"])
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-            self.table.setItem(row, 1, type_item)
+        # Ensure no row, column, or cell is selected when the table is first displayed
+        self.table.clearSelection()
 
-            # Default value column (editable by default)
-            self.table.setItem(row, 2, QTableWidgetItem(str(data["default"])))
+    def set_table_row(self, row, name, data):
+        """Fill one row of the main table for a variable."""
+        # Name column (editable by default)
+        self.table.setItem(row, 0, QTableWidgetItem(name))
 
-            # Manage Overrides button
-            button = QPushButton("Manage Overrides")
-            button.clicked.connect(lambda _, n=name: self.manage_overrides(n))
-            self.table.setCellWidget(row, 3, button)
+        # Type column (non-editable)
+        type_item = QTableWidgetItem(data["type"])
+        type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
+        self.table.setItem(row, 1, type_item)
 
-        # Ensure no row, column, or cell is selected when the table is first displayed
-        self.table.clearSelection()
+        # Default value column (editable by default)
+        self.table.setItem(row, 2, QTableWidgetItem(str(data["default"])))
+
+        # Overrides column (non-editable), a plain item rather than a button widget per row,
+        # which is what made large tables slow to fill. Double-click opens the dialog.
+        overrides_item = QTableWidgetItem("Manage Overrides...")
+        overrides_item.setFlags(overrides_item.flags() & ~Qt.ItemIsEditable)
+        overrides_item.setToolTip("Double-click to manage overrides")
+        self.table.setItem(row, 3, overrides_item)
+
+    def on_table_cell_double_clicked(self, row, column):
+        """Open the overrides dialog when the Override Per Shot cell is double-clicked."""
+        if column == 3:
+            self.manage_overrides(self.table.item(row, 0).text())
 
     def delete_selected_row(self):
         """Delete the selected row in the main table."""
@@ -236,6 +370,7 @@ class VariableManager(QWidget):
             if variable_name in self.variables:
                 del self.variables[variable_name]
                 self.table.removeRow(selected_row)
+                self.setWindowModified(True)
                 QMessageBox.information(self, "Success", f"Variable '{variable_name}' deleted.")
             else:
                 QMessageBox.warning(self, "Error", f"Variable '{variable_name}' not found.")
@@ -244,6 +379,21 @@ class VariableManager(QWidget):
 
     def add_variable(self):
         """Add a new variable through a dialog with validation."""
+        if self.add_variable_dialog is None:
+            self.build_add_variable_dialog()
+
+        # Reset the reused dialog to a blank string variable
+        self.add_variable_name_input.clear()
+        self.add_variable_type_input.blockSignals(True)
+        self.add_variable_type_input.setCurrentIndex(0)
+        self.add_variable_type_input.blockSignals(False)
+        self.update_default_input()
+
+        # validate_and_add_variable refreshes the table before accepting the dialog
+        self.add_variable_dialog.exec_()
+
+    def build_add_variable_dialog(self):
+        """Build the Add Variable dialog once; add_variable reuses it on every open."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Add Variable")
 
@@ -257,46 +407,7 @@ class VariableManager(QWidget):
         self.current_default_input = QLineEdit()  # Default input widget
         self.default_input_container.addWidget(self.current_default_input)
 
-        def update_default_input():
-            """Update the input field based on the selected type."""
-            # Clear existing widgets
-            while self.default_input_container.count():
-                item = self.default_input_container.takeAt(0)
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-
-            selected_type = type_input.currentText()
-            if selected_type == "color":
-                # Create color picker button for color input
-                color_button = QPushButton("Select Color")
-                color_button.clicked.connect(self.select_color)
-                self.default_input_container.addWidget(color_button)
-                self.current_default_input = color_button
-            elif selected_type == "vector":
-                x_input = QLineEdit()
-                x_input.setPlaceholderText("x")
-                y_input = QLineEdit()
-                y_input.setPlaceholderText("y")
-                z_input = QLineEdit()
-                z_input.setPlaceholderText("z")
-                vector_layout = QHBoxLayout()
-                vector_layout.addWidget(x_input)
-                vector_layout.addWidget(y_input)
-                vector_layout.addWidget(z_input)
-                self.default_input_container.addLayout(vector_layout)
-                self.current_default_input = (x_input, y_input, z_input)
-            elif selected_type == "boolean":
-                boolean_input = QComboBox()
-                boolean_input.addItems(["True", "False"])
-                self.default_input_container.addWidget(boolean_input)
-                self.current_default_input = boolean_input
-            else:
-                default_input = QLineEdit()
-                self.default_input_container.addWidget(default_input)
-                self.current_default_input = default_input
-
-        type_input.currentIndexChanged.connect(update_default_input)
+        type_input.currentIndexChanged.connect(self.update_default_input)
 
         form_layout.addRow("Name:", name_input)
         form_layout.addRow("Type:", type_input)
@@ -311,9 +422,54 @@ class VariableManager(QWidget):
         layout.addWidget(buttons)
         dialog.setLayout(layout)
 
-        if dialog.exec_() == QDialog.Accepted:
-            # After the dialog is accepted, ensure the variable is added correctly
-            self.refresh_table()
+        self.add_variable_dialog = dialog
+        self.add_variable_name_input = name_input
+        self.add_variable_type_input = type_input
+
+    def update_default_input(self):
+        """Update the Add Variable default input field based on the selected type."""
+        # Clear existing widgets, including the row layout used for vectors
+        while self.default_input_container.count():
+            item = self.default_input_container.takeAt(0)
+            widget = item.widget()
+            if widget:
+                widget.deleteLater()
+            elif item.layout():
+                while item.layout().count():
+                    child = item.layout().takeAt(0).widget()
+                    if child:
+                        child.deleteLater()
+                item.layout().deleteLater()
+
+        selected_type = self.add_variable_type_input.currentText()
+        if selected_type == "color":
+            # Create color picker button for color input
+            color_button = QPushButton("Select Color")
+            color_button.clicked.connect(self.select_color)
+            self.default_input_container.addWidget(color_button)
+            self.current_default_input = color_button
+        elif selected_type == "vector":
+            x_input = QLineEdit()
+            x_input.setPlaceholderText("x")
+            y_input = QLineEdit()
+            y_input.setPlaceholderText("y")
+            z_input = QLineEdit()
+            z_input.setPlaceholderText("z")
+            vector_layout = QHBoxLayout()
+            vector_layout.addWidget(x_input)
+            vector_layout.addWidget(y_input)
+            vector_layout.addWidget(z_input)
+            self.default_input_container.addLayout(vector_layout)
+            self.current_default_input = (x_input, y_input, z_input)
+        elif selected_type == "boolean":
+            boolean_input = QComboBox()
+            boolean_input.addItems(["True", "False"])
+            self.default_input_container.addWidget(boolean_input)
+            self.current_default_input = boolean_input
+        else:
+            default_input = QLineEdit()
+            self.default_input_container.addWidget(default_input)
+            self.current_default_input = default_input
 
     def select_color(self):
         """Open the color picker dialog and set the color."""
@@ -328,8 +484,32 @@ class VariableManager(QWidget):
             QMessageBox.warning(self, "Error", "Variable not found!")
             return
 
+        if self.overrides_dialog is None:
+            self.build_overrides_dialog()
+
+        # Point the reused dialog at this variable
+        self.overrides_variable_name = variable_name
+        self.overrides_dialog.setWindowTitle(f"Manage Overrides for {variable_name}")
+        self.overrides_shot_input.clear()
+        self.overrides_value_input.clear()
+
+        # Populate table with existing overrides, without triggering on_override_item_changed
+        overrides_table = self.overrides_table
+        overrides_table.blockSignals(True)
+        overrides_table.setRowCount(0)
+        overrides = self.variables[variable_name].get("overrides", {})
+        overrides_table.setRowCount(len(overrides))
+        for row, (shot, value) in enumerate(overrides.items()):
+            overrides_table.setItem(row, 0, QTableWidgetItem(shot))
+            overrides_table.setItem(row, 1, QTableWidgetItem(repr(value)))  # Use repr for display
+        overrides_table.blockSignals(False)
+
+        # Open the dialog
+        self.overrides_dialog.exec_()
+
+    def build_overrides_dialog(self):
+        """Build the Manage Overrides dialog once; manage_overrides reuses it for every variable."""
         dialog = QDialog(self)
-        dialog.setWindowTitle(f"Manage Overrides for {variable_name}")
 
         # Layout for overrides
         layout = QVBoxLayout()
@@ -339,21 +519,10 @@ class VariableManager(QWidget):
         overrides_table.setHorizontalHeaderLabels(["Shot", "Value"])
         overrides_table.setEditTriggers(QTableWidget.AllEditTriggers)  # Allow editing in all columns
         overrides_table.itemChanged.connect(
-            lambda item: self.on_override_item_changed(variable_name, item, overrides_table)
+            lambda item: self.on_override_item_changed(self.overrides_variable_name, item, overrides_table)
         )  # Connect item changes
         layout.addWidget(overrides_table)
 
-        # Populate table with existing overrides
-        variable_data = self.variables[variable_name]
-        overrides = variable_data.get("overrides", {})
-
-        # Safely iterate over a copy of the overrides dictionary
-        for shot, value in list(overrides.items()):  # Create a copy of the items to iterate safely
-            row = overrides_table.rowCount()
-            overrides_table.insertRow(row)
-            overrides_table.setItem(row, 0, QTableWidgetItem(shot))
-            overrides_table.setItem(row, 1, QTableWidgetItem(repr(value)))  # Use repr for display
-
         # Add new override input fields
         shot_input = QLineEdit()
         shot_input.setPlaceholderText("Shot (e.g., shot01)")
@@ -363,12 +532,12 @@ class VariableManager(QWidget):
 
         add_override_button = QPushButton("Add/Update Override")
         add_override_button.clicked.connect(
-            lambda: self.add_or_update_override(variable_name, shot_input, value_input, overrides_table)
+            lambda: self.add_or_update_override(self.overrides_variable_name, shot_input, value_input, overrides_table)
         )
 
         delete_override_button = QPushButton("Delete Selected Override")
         delete_override_button.clicked.connect(
-            lambda: self.delete_selected_override(variable_name, overrides_table)
+            lambda: self.delete_selected_override(self.overrides_variable_name, overrides_table)
         )
 
         layout.addWidget(QLabel("Add/Update Override:"))
@@ -385,8 +554,10 @@ class VariableManager(QWidget):
 
         dialog.setLayout(layout)
 
-        # Open the dialog
-        dialog.exec_()
+        self.overrides_dialog = dialog
+        self.overrides_table = overrides_table
+        self.overrides_shot_input = shot_input
+        self.overrides_value_input = value_input
 
     def delete_selected_override(self, variable_name, overrides_table):
         """Delete the selected override from the table and dictionary."""
@@ -400,6 +571,7 @@ class VariableManager(QWidget):
         # Remove the override from the dictionary
         if shot in self.variables[variable_name]["overrides"]:
             del self.variables[variable_name]["overrides"][shot]
+            self.variables_changed.emit([(variable_name, shot)])
             QMessageBox.information(self, "Success", f"Override for shot '{shot}' deleted.")
             self.refresh_overrides_table(variable_name, overrides_table)
         else:
@@ -407,12 +579,14 @@ class VariableManager(QWidget):
 
     def refresh_overrides_table(self, variable_name, overrides_table):
         """Refresh the overrides table to reflect the current state."""
+        overrides_table.blockSignals(True)
         overrides_table.setRowCount(0)
         for shot, value in self.variables[variable_name].get("overrides", {}).items():
             row = overrides_table.rowCount()
             overrides_table.insertRow(row)
             overrides_table.setItem(row, 0, QTableWidgetItem(shot))
             overrides_table.setItem(row, 1, QTableWidgetItem(str(value)))
+        overrides_table.blockSignals(False)
 
     def add_or_update_override(self, variable_name, shot_input, value_input, overrides_table):
         """Add or update an override for a specific variable."""
@@ -426,21 +600,11 @@ class VariableManager(QWidget):
         variable_type = self.variables[variable_name]["type"]
 
         try:
-            if variable_type == "boolean":
-                if value.lower() not in ["true", "false"]:
-                    raise ValueError("Invalid boolean value. Please enter 'True' or 'False'.")
-                value = value.lower() == "true"
-            elif variable_type == "color":
-                value = self.validate_color(value)
-            elif variable_type == "vector":
-                value = self.validate_vector(value)
-            elif variable_type == "integer":
-                value = int(value)
-            elif variable_type == "float":
-                value = float(value)
+            value = self.convert_override_value(variable_type, value)
 
             # Store the converted value
             self.variables[variable_name]["overrides"][shot] = value
+            self.variables_changed.emit([(variable_name, shot)])
 
             # Update or insert the value in the table
             for row in range(overrides_table.rowCount()):
@@ -457,6 +621,243 @@ class VariableManager(QWidget):
         except ValueError as e:
             QMessageBox.warning(self, "Error", str(e))
 
+    def convert_override_value(self, variable_type, value):
+        """Validate and convert a text override value based on the variable type."""
+        if variable_type == "boolean":
+            if value.lower() not in ["true", "false"]:
+                raise ValueError("Invalid boolean value. Please enter 'True' or 'False'.")
+            return value.lower() == "true"
+        elif variable_type == "color":
+            return self.validate_color(value)  # Validate color (RGB format)
+        elif variable_type == "vector":
+            vector_parts = self.validate_vector(value)  # Validate vector (X, Y, Z)
+            if not all(math.isfinite(x) for x in vector_parts):
+                raise ValueError("Vector values must be finite numbers.")
+            return vector_parts
+        elif variable_type == "integer":
+            return int(value)  # Convert to integer
+        elif variable_type == "float":
+            value = float(value)  # Convert to float
+            if not math.isfinite(value):
+                raise ValueError("Float value must be a finite number.")
+            return value
+        return value
+
+    def transform_value(self, variable_type, current_value, mode, factor):
+        """Apply an offset or scale to a numeric value, component-wise for colors and vectors."""
+        def apply(component):
+            return component + factor if mode == "offset" else component * factor
+
+        if variable_type == "integer":
+            result = apply(int(current_value))
+        elif variable_type == "float":
+            result = apply(float(current_value))
+        else:
+            result = [apply(float(x)) for x in current_value]
+
+        # A finite amount can still overflow to inf, which JSON cannot store
+        if not all(math.isfinite(x) for x in (result if isinstance(result, list) else [result])):
+            raise ValueError("Result is too large.")
+
+        if variable_type == "integer":
+            return int(round(result))
+        elif variable_type == "color":
+            color_parts = [int(round(x)) for x in result]
+            if not all(0 <= x <= 255 for x in color_parts):
+                raise ValueError("Each color component must be between 0 and 255.")
+            return color_parts
+        return result
+
+    def apply_bulk_edit(self, variable_names, shots, mode, value):
+        """Apply a value or transform to every variable x shot pair in one transaction.
+
+        mode is one of "set", "offset" or "scale". Offsets and scales are applied to the
+        existing override, or to the default when the shot has no override yet. All pairs
+        are validated before anything is changed; on failure a ValueError with one line per
+        problem variable is raised and the variables are left untouched. On success a single
+        undo entry is recorded and variables_changed is emitted once.
+        """
+        if mode not in BULK_EDIT_MODES:
+            raise ValueError(f"Unknown bulk edit mode '{mode}'.")
+
+        shots = list(dict.fromkeys(shot.strip() for shot in shots if shot.strip()))
+        if not variable_names:
+            raise ValueError("No variables selected.")
+        if not shots:
+            raise ValueError("No shots specified.")
+
+        if mode != "set":
+            try:
+                factor = float(value)
+            except ValueError:
+                factor = math.nan
+            if not math.isfinite(factor):
+                raise ValueError(f"Invalid amount for {mode}: '{value}'. Please enter a finite number.")
+
+        # Validate every pair first so the edit is all or nothing
+        pending = []
+        errors = []
+        for name in variable_names:
+            if name not in self.variables:
+                errors.append(f"{name}: variable not found.")
+                continue
+            variable_data = self.variables[name]
+            variable_type = variable_data["type"]
+            overrides = variable_data.get("overrides", {})
+
+            if mode == "set":
+                try:
+                    new_value = self.convert_override_value(variable_type, str(value).strip())
+                except ValueError as e:
+                    errors.append(f"{name}: {e}")
+                    continue
+                pending.extend((name, shot, new_value) for shot in shots)
+                continue
+
+            if variable_type not in NUMERIC_TYPES:
+                errors.append(f"{name}: cannot {mode} a {variable_type} value.")
+                continue
+
+            # Group failures by message so one variable gives one line, not one per shot
+            failed_shots = {}
+            for shot in shots:
+                try:
+                    current_value = overrides.get(shot, variable_data["default"])
+                    new_value = self.transform_value(variable_type, current_value, mode, factor)
+                except (TypeError, ValueError, OverflowError) as e:
+                    failed_shots.setdefault(str(e), []).append(shot)
+                    continue
+                pending.append((name, shot, new_value))
+
+            for message, bad_shots in failed_shots.items():
+                shown = ", ".join(bad_shots[:5]) + (", ..." if len(bad_shots) > 5 else "")
+                errors.append(f"{name}: {message} ({len(bad_shots)} shots: {shown})")
+
+        if errors:
+            raise ValueError("Bulk edit failed, no changes were made:\n" + "\n".join(errors))
+
+        # Commit, remembering the previous state for undo
+        undo_entry = []
+        for name, shot, new_value in pending:
+            variable_data = self.variables[name]
+            overrides = variable_data.setdefault("overrides", {})
+            undo_entry.append((name, variable_data, shot, shot in overrides, overrides.get(shot), new_value))
+            overrides[shot] = new_value
+
+        self.undo_stack.append(undo_entry)
+        self.variables_changed.emit([(name, shot) for name, shot, _ in pending])
+        return len(pending)
+
+    def undo_last_edit(self):
+        """Revert the most recent bulk edit, unless its overrides have been edited since."""
+        if not self.undo_stack:
+            QMessageBox.warning(self, "Error", "No bulk edit to undo.")
+            return
+
+        undo_entry = self.undo_stack.pop()
+
+        # Refuse if any touched override no longer holds the value the bulk edit wrote,
+        # or its variable was deleted or replaced since
+        for name, variable_data, shot, _, _, new_value in undo_entry:
+            overrides = variable_data.get("overrides", {})
+            if self.variables.get(name) is not variable_data or shot not in overrides or overrides[shot] != new_value:
+                QMessageBox.warning(self, "Error", f"Cannot undo the bulk edit: override '{name}' / '{shot}' has changed since, so this edit can no longer be undone.")
+                return
+
+        # Restore in reverse so repeated pairs end up at their original value
+        for name, variable_data, shot, had_override, old_value, _ in reversed(undo_entry):
+            if had_override:
+                variable_data["overrides"][shot] = old_value
+            else:
+                variable_data["overrides"].pop(shot, None)
+
+        self.variables_changed.emit([(name, shot) for name, _, shot, _, _, _ in undo_entry])
+
+    def bulk_edit(self):
+        """Open a dialog to edit overrides for several variables and shots at once."""
+        if self.bulk_edit_dialog is None:
+            self.build_bulk_edit_dialog()
+
+        # Reset the reused dialog, preselecting the variables selected in the main table
+        selected_rows = {index.row() for index in self.table.selectedIndexes()}
+        selected_names = {self.table.item(row, 0).text() for row in selected_rows}
+        variables_list = self.bulk_variables_list
+        variables_list.blockSignals(True)
+        variables_list.clear()
+        variables_list.addItems(list(self.variables.keys()))
+        for row in range(variables_list.count()):
+            if variables_list.item(row).text() in selected_names:
+                variables_list.item(row).setSelected(True)
+        variables_list.blockSignals(False)
+
+        self.bulk_shots_input.clear()
+        self.bulk_shots_input.setModified(False)
+        self.fill_bulk_edit_shots()
+        self.bulk_mode_input.setCurrentIndex(0)
+        self.bulk_value_input.clear()
+
+        self.bulk_edit_dialog.exec_()
+
+    def build_bulk_edit_dialog(self):
+        """Build the Bulk Edit dialog once; bulk_edit reuses it on every open."""
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Bulk Edit Overrides")
+
+        form_layout = QFormLayout()
+
+        variables_list = QListWidget()
+        variables_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        variables_list.itemSelectionChanged.connect(self.fill_bulk_edit_shots)
+
+        shots_input = QLineEdit()
+        shots_input.setPlaceholderText("Shots, comma separated (e.g., shot01, shot02)")
+
+        mode_input = QComboBox()
+        mode_input.addItems(BULK_EDIT_MODES)
+
+        value_input = QLineEdit()
+        value_input.setPlaceholderText("Value, or amount for offset/scale")
+
+        form_layout.addRow("Variables:", variables_list)
+        form_layout.addRow("Shots:", shots_input)
+        form_layout.addRow("Mode:", mode_input)
+        form_layout.addRow("Value:", value_input)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.apply_bulk_edit_dialog)
+        buttons.rejected.connect(dialog.reject)
+
+        layout = QVBoxLayout()
+        layout.addLayout(form_layout)
+        layout.addWidget(buttons)
+        dialog.setLayout(layout)
+
+        self.bulk_edit_dialog = dialog
+        self.bulk_variables_list = variables_list
+        self.bulk_shots_input = shots_input
+        self.bulk_mode_input = mode_input
+        self.bulk_value_input = value_input
+
+    def fill_bulk_edit_shots(self):
+        """Offer the selected variables' existing override shots, until the user types their own."""
+        if self.bulk_shots_input.isModified():
+            return
+        names = [item.text() for item in self.bulk_variables_list.selectedItems()]
+        shots = sorted({shot for name in names for shot in self.variables[name].get("overrides", {})})
+        self.bulk_shots_input.setText(", ".join(shots))
+
+    def apply_bulk_edit_dialog(self):
+        """Apply the Bulk Edit dialog, keeping it open with the error if validation fails."""
+        names = [item.text() for item in self.bulk_variables_list.selectedItems()]
+        shots = self.bulk_shots_input.text().split(",")
+        try:
+            count = self.apply_bulk_edit(names, shots, self.bulk_mode_input.currentText(), self.bulk_value_input.text())
+        except ValueError as e:
+            QMessageBox.warning(self.bulk_edit_dialog, "Error", str(e))
+            return
+        print(f"Bulk edit applied to {count} overrides")
+        self.bulk_edit_dialog.accept()
+
     def validate_color(self, value):
         """Validate and parse the color input (RGB format)."""
         try:
@@ -598,6 +999,8 @@ class VariableManager(QWidget):
 
         # Re-enable signals after processing the change
         self.table.blockSignals(False)
+        if column == 2:
+            self.setWindowModified(True)
 
     def on_override_item_changed(self, variable_name, item, overrides_table):
         """Handle the event when an override item is edited."""
@@ -615,6 +1018,7 @@ class VariableManager(QWidget):
             if new_shot != shot:
                 # Update the backend with the new shot key (without any validation)
                 self.variables[variable_name]["overrides"][new_shot] = self.variables[variable_name]["overrides"].pop(shot)
+                self.variables_changed.emit([(variable_name, shot), (variable_name, new_shot)])
 
         # If the Value column (1) is edited
         elif column == 1:
@@ -627,21 +1031,11 @@ class VariableManager(QWidget):
 
             try:
                 # Validate and convert the value based on its type
-                if variable_type == "boolean":
-                    if value.lower() not in ["true", "false"]:
-                        raise ValueError("Invalid boolean value. Please enter 'True' or 'False'.")
-                    value = value.lower() == "true"
-                elif variable_type == "color":
-                    value = self.validate_color(value)  # Validate color (RGB format)
-                elif variable_type == "vector":
-                    value = self.validate_vector(value)  # Validate vector (X, Y, Z)
-                elif variable_type == "integer":
-                    value = int(value)  # Convert to integer
-                elif variable_type == "float":
-                    value = float(value)  # Convert to float
+                value = self.convert_override_value(variable_type, value)
 
                 # Update the backend override
                 self.variables[variable_name]["overrides"][shot] = value
+                self.variables_changed.emit([(variable_name, shot)])
 
             except ValueError as e:
                 # Revert the value in the table to the previous valid value
@@ -651,18 +1045,6 @@ class VariableManager(QWidget):
                 overrides_table.blockSignals(False)
                 QMessageBox.warning(self, "Error", str(e))
 
-# If not running directly as main, ensure this part runs manually
-app = QApplication(sys.argv)
-
-# Set the font to Open Sans regular (or fallback to Arial if not available)
-font = QFont("Open Sans", 10)  # Font size 10
-if not font.family() == "Open Sans":
-    font = QFont("Arial", 10)  # Fallback to Arial if Open Sans is unavailable
-app.setFont(font)
-
-# Initialize the main window
-window = VariableManager()
-window.show()
-
-# Run the application
-sys.exit(app.exec_())
\ No newline at end of file
+if __name__ == "__main__":
+    from main import main
+    main()